@@ -101,14 +101,15 @@ def main() -> None:
     images.add_img(data)
 
     logging.info("-- 80 Generate info card")
+    room_children = sections.collect_room_children(data)
     sections.extract_tumonline_props(data)
-    sections.compute_floor_prop(data)
+    sections.compute_floor_prop(data, room_children)
     sections.compute_props(data)
     sections.localize_links(data)
 
     logging.info("-- 81 Generate overview sections")
     sections.generate_buildings_overview(data)
-    sections.generate_rooms_overview(data)
+    sections.generate_rooms_overview(data, room_children)
 
     logging.info("-- 90 Search: Build base ranking")
     search.add_ranking_base(data)
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import msgspec
 import pydantic
 from pydantic import BaseModel
 
@@ -17,6 +18,17 @@ class PydanticConfiguration(BaseModel):
 RESULTS_PATH = Path(__file__).parent.parent / "results"
 
 
+class MsgspecConfiguration(msgspec.Struct, forbid_unknown_fields=True):
+    """Base of the scraped input DTOs, mirroring `extra="forbid"` and `str_strip_whitespace` of pydantic"""
+
+    def __post_init__(self) -> None:
+        """Strip the whitespace around all str fields"""
+        for field in self.__struct_fields__:
+            value = getattr(self, field)
+            if isinstance(value, str):
+                setattr(self, field, value.strip())
+
+
 class TranslatableStr(PydanticConfiguration):
     # pylint: disable-next=invalid-name
     de: str
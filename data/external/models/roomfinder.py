@@ -1,10 +1,13 @@
-import json
-import typing
+import functools
 
-from external.models.common import PydanticConfiguration, RESULTS_PATH
+import msgspec
 
+from external.models.common import RESULTS_PATH, MsgspecConfiguration
+
+
+class RfMap(MsgspecConfiguration, array_like=True):
+    """Map reference, scraped as JSON array"""
 
-class RfMap(typing.NamedTuple):
     scale: str
     map_id: str
     name: str
@@ -13,7 +16,7 @@ class RfMap(typing.NamedTuple):
 
 
 # pylint: disable-next=too-many-instance-attributes
-class Building(PydanticConfiguration):
+class Building(MsgspecConfiguration):
     lat: float
     lon: float
     b_alias: str
@@ -27,11 +30,11 @@ class Building(PydanticConfiguration):
     @classmethod
     def load_all(cls) -> list["Building"]:
         """Load all nat.Building's"""
-        with (RESULTS_PATH / "buildings_roomfinder.json").open(encoding="utf-8") as file:
-            return [cls.model_validate(item) for item in json.load(file)]
+        with (RESULTS_PATH / "buildings_roomfinder.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=list[Building])
 
 
-class LatLonBox(PydanticConfiguration):
+class LatLonBox(MsgspecConfiguration):
     north: float
     south: float
     east: float
@@ -39,7 +42,7 @@ class LatLonBox(PydanticConfiguration):
     rotation: float
 
 
-class Map(PydanticConfiguration):
+class Map(MsgspecConfiguration):
     # pylint: disable-next=invalid-name
     id: str
     desc: str
@@ -47,17 +50,31 @@ class Map(PydanticConfiguration):
     width: int
     scale: str
     latlonbox: LatLonBox
-    file: str
+    file: str = ""
     source: str = "Roomfinder"
 
+    def __post_init__(self) -> None:
+        """Fall back to the scraped `{id}.webp` if no file was given"""
+        super().__post_init__()
+        if not self.file:
+            self.file = f"{self.id}.webp"
+
     @classmethod
     def load_all(cls) -> list["Map"]:
         """Load all nat.Map's"""
-        with (RESULTS_PATH / "maps_roomfinder.json").open(encoding="utf-8") as file:
-            return [cls(file=f"{item['id']}.webp", **item) for item in json.load(file)]
+        return list(_load_maps())
+
+
+# The maps are loaded multiple times during map assignment => the parsed maps are cached per process.
+# The cached Map's are shared between all callers and must not be modified.
+@functools.cache
+def _load_maps() -> tuple[Map, ...]:
+    with (RESULTS_PATH / "maps_roomfinder.json").open("rb") as file:
+        # the latlonbox is scraped as strings => non-strict decoding to get floats
+        return msgspec.json.decode(file.read(), type=tuple[Map, ...], strict=False)
 
 
-class RoomMetadata(PydanticConfiguration):
+class RoomMetadata(MsgspecConfiguration):
     m_desc: str
     m_name: str
     m_size: int
@@ -65,7 +82,7 @@ class RoomMetadata(PydanticConfiguration):
     meta_id: int
 
 
-class Room(PydanticConfiguration):
+class Room(MsgspecConfiguration):
     # room specific properties
     lat: float
     lon: float
@@ -86,5 +103,5 @@ class Room(PydanticConfiguration):
     @classmethod
     def load_all(cls) -> list["Room"]:
         """Load all nat.Room's"""
-        with (RESULTS_PATH / "rooms_roomfinder.json").open(encoding="utf-8") as file:
-            return [cls.model_validate(item) for item in json.load(file) if item]
+        with (RESULTS_PATH / "rooms_roomfinder.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=list[Room])
@@ -1,5 +1,6 @@
 from typing import Literal
 
+import msgspec
 import pytest
 
 from external.models import nat, public_transport, roomfinder, tumonline
@@ -40,11 +41,38 @@ def test_roomfinder_building():
     roomfinder.Building.load_all()
 
 
+def test_roomfinder_building_strips_whitespace():
+    """Whitespace around str values is stripped, including within the map references"""
+    raw_building = {
+        "lat": 48.15,
+        "lon": 11.56,
+        "b_alias": " U-Trakt ",
+        "b_area": "München - Stammgelände Nord",
+        "b_id": "0101",
+        "b_name": "N1\n",
+        "default_map": [" 4000 ", " rf1 ", "Stammgelände Basiskarte\t", 501, 484],
+        "maps": [[" 4000 ", " rf1 ", "Stammgelände Basiskarte\t", 501, 484]],
+        "b_room_count": 439,
+    }
+    building = msgspec.json.decode(msgspec.json.encode(raw_building), type=roomfinder.Building)
+    assert (building.b_alias, building.b_name) == ("U-Trakt", "N1")
+    expected_map = roomfinder.RfMap(scale="4000", map_id="rf1", name="Stammgelände Basiskarte", width=501, height=484)
+    assert building.default_map == expected_map
+    assert building.maps == [expected_map]
+
+
 def test_tumonline_room():
     """Load all rooms from the tumonline.Room"""
     tumonline.Room.load_all()
 
 
+def test_tumonline_room_is_not_shared():
+    """Patching a loaded tumonline.Room must not leak into later loads"""
+    room_code, room = next(iter(tumonline.Room.load_all().items()))
+    room.patched = True
+    assert not tumonline.Room.load_all()[room_code].patched
+
+
 def test_tumonline_building():
     """Load all buildings from the tumonline.Building"""
     tumonline.Building.load_all()
@@ -1,22 +1,22 @@
-import json
+import msgspec
 
-from external.models.common import PydanticConfiguration, RESULTS_PATH
+from external.models.common import RESULTS_PATH, MsgspecConfiguration
 
 
-class Address(PydanticConfiguration):
+class Address(MsgspecConfiguration):
     place: str
     street: str
     zip_code: int
 
 
-class Seats(PydanticConfiguration):
+class Seats(MsgspecConfiguration):
     sitting: int | None = None
     wheelchair: int | None = None
     standing: int | None = None
 
 
 # pylint: disable-next=too-many-instance-attributes
-class Room(PydanticConfiguration):
+class Room(MsgspecConfiguration):
     address: Address
     seats: Seats
     floor_type: str
@@ -34,11 +34,11 @@ class Room(PydanticConfiguration):
     @classmethod
     def load_all(cls) -> dict[str, "Room"]:
         """Load all tumonline.Room's"""
-        with (RESULTS_PATH / "rooms_tumonline.json").open(encoding="utf-8") as file:
-            return {key: cls.model_validate(item) for key, item in json.load(file).items()}
+        with (RESULTS_PATH / "rooms_tumonline.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=dict[str, Room])
 
 
-class Building(PydanticConfiguration):
+class Building(MsgspecConfiguration):
     address: Address
     area_id: int
     name: str
@@ -48,11 +48,11 @@ class Building(PydanticConfiguration):
     @classmethod
     def load_all(cls) -> dict[str, "Building"]:
         """Load all tumonline.Building's"""
-        with (RESULTS_PATH / "buildings_tumonline.json").open(encoding="utf-8") as file:
-            return {key: cls.model_validate(item) for key, item in json.load(file).items()}
+        with (RESULTS_PATH / "buildings_tumonline.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=dict[str, Building])
 
 
-class Organisation(PydanticConfiguration):
+class Organisation(MsgspecConfiguration):
     code: str
     name: str
     path: str
@@ -60,11 +60,11 @@ class Organisation(PydanticConfiguration):
     @classmethod
     def load_all_for(cls, lang: str) -> dict[int, "Organisation"]:
         """Load all tumonline.Organisation's for a specific language"""
-        with (RESULTS_PATH / f"orgs-{lang}_tumonline.json").open(encoding="utf-8") as file:
-            return {int(key): cls.model_validate(item) for key, item in json.load(file).items()}
+        with (RESULTS_PATH / f"orgs-{lang}_tumonline.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=dict[int, Organisation])
 
 
-class Usage(PydanticConfiguration):
+class Usage(MsgspecConfiguration):
     din277_id: str
     din277_name: str
     name: str
@@ -72,5 +72,5 @@ class Usage(PydanticConfiguration):
     @classmethod
     def load_all(cls) -> dict[int, "Usage"]:
         """Load all tumonline.Usage's"""
-        with (RESULTS_PATH / "usages_tumonline.json").open(encoding="utf-8") as file:
-            return {int(key): cls.model_validate(item) for key, item in json.load(file).items()}
+        with (RESULTS_PATH / "usages_tumonline.json").open("rb") as file:
+            return msgspec.json.decode(file.read(), type=dict[int, Usage])
@@ -2,9 +2,10 @@ import json
 import re
 from pathlib import Path
 from typing import Any
+import msgspec
 import polars as pl
 
-from external.models.common import PydanticConfiguration
+from external.models.common import MsgspecConfiguration, PydanticConfiguration
 from utils import TranslatableStr
 from utils import TranslatableStr as _
 
@@ -155,6 +156,8 @@ def _make_sure_is_safe(obj: object):
             _make_sure_is_safe(entry)
     elif isinstance(obj, PydanticConfiguration):
         return _make_sure_is_safe(obj.model_dump())
+    elif isinstance(obj, MsgspecConfiguration):
+        return _make_sure_is_safe(msgspec.to_builtins(obj))
     elif isinstance(obj, bool) or isinstance(obj, int) or isinstance(obj, float) or obj is None:
         pass
     else:
@@ -215,4 +218,6 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         """Enhanced JSONEncoder that can handle dataclasses"""
         if isinstance(o, PydanticConfiguration):
             return o.model_dump()
+        if isinstance(o, MsgspecConfiguration):
+            return msgspec.to_builtins(o)
         return super().default(o)
@@ -1,106 +1,169 @@
+import functools
 import typing
+from collections.abc import Iterable
+from operator import itemgetter
 from typing import Any
 
 from utils import TranslatableStr
 
 _ = TranslatableStr
 
+# The translations are constant, so they are only looked up once.
+# Templates have to be filled via .format(), which returns a new TranslatableStr.
+GROUND_FLOOR_NAME = _("Erdgeschoss")
+ROOF_FLOOR_NAME = _("Dachgeschoss")
+TP_FLOOR_NAME = _("Tiefparterre")
+FIRST_MEZZANINE_NAME = _("1. Zwischengeschoss, über EG")
+BASEMENT_SUFFIX = _("Untergeschoss")
+MEZZANINE_SUFFIX = _("Zwischengeschoss")
+UPPER_FLOOR_SUFFIX = _("Obergeschoss")
+UPPER_FLOOR_ONE_MEZZANINE_SUFFIX = _("OG + 1 Zwischengeschoss")
+UPPER_FLOOR_MEZZANINES_SUFFIX = _("OG + {m} Zwischengeschosse")
+
+NO_ROOMS_SUBTEXT = _("Keine Räume bekannt")
+BUILDING_SUBTEXT = _("{n_rooms} Räume")
+AREA_SUBTEXT = _("{n_buildings} Gebäude, {n_rooms} Räume")
+SITE_SUBTEXT = _("{n_buildings} Gebäude, {n_rooms} Räume (Außenstelle)")
+
+UNKNOWN_USAGE_NAME = _("Unbekannt")
+
+BUILDING_ID_LABEL = _("Gebäudekennung")
+BUILDING_IDS_LABEL = _("Gebäudekennungen")
+ROOMCODE_LABEL = _("Raumkennung")
+ARCH_NAME_LABEL = _("Architekten-Name")
+FLOOR_LABEL = _("Stockwerk")
+ADDRESS_LABEL = _("Adresse")
+N_BUILDINGS_LABEL = _("Anzahl Gebäude")
+N_SEATS_LABEL = _("Sitzplätze")
+N_ROOMS_LABEL = _("Anzahl Räume")
+N_ROOMS_WITH_REGULAR_TEMPLATE = _("{n_rooms} ({n_rooms_reg} ohne Flure etc.)")
+
+BUILDING_TYPES = frozenset({"building", "joined_building"})
+BUILDINGS_OVERVIEW_PARENT_TYPES = frozenset({"area", "site", "campus"})
+BUILDINGS_OVERVIEW_CHILD_TYPES = BUILDINGS_OVERVIEW_PARENT_TYPES | BUILDING_TYPES
+ROOMS_OVERVIEW_PARENT_TYPES = BUILDINGS_OVERVIEW_CHILD_TYPES | {"virtual_room"}
+NON_TRIVIAL_FLOOR_TYPES = frozenset({"roof", "tp"})
+
 
 def extract_tumonline_props(data: dict[str, dict[str, Any]]) -> None:
     """Extract some of the TUMonline data and provides it as `prop`."""
     for entry in data.values():
-        if entry.get("tumonline_data", {}).get("calendar", None):
-            calendar_resource_id = entry["tumonline_data"]["calendar"]
+        tumonline_data = entry.get("tumonline_data")
+        if not tumonline_data:
+            continue
+        if calendar_resource_id := tumonline_data.get("calendar"):
             calendar_url = f"https://campus.tum.de/tumonline/tvKalender.wSicht?cOrg=0&cRes={calendar_resource_id}"
             entry["props"]["calendar_url"] = calendar_url
-        if entry.get("tumonline_data", {}).get("operator", None):
+        if operator := tumonline_data.get("operator"):
+            operator_id = tumonline_data["operator_id"]
             entry["props"]["operator"] = {
-                "code": entry["tumonline_data"]["operator"],
-                "name": entry["tumonline_data"]["operator_name"],
-                "url": (
-                    f"https://campus.tum.de/tumonline/webnav.navigate_to"
-                    f"?corg={entry['tumonline_data']['operator_id']}"
-                ),
-                "id": entry["tumonline_data"]["operator_id"],
+                "code": operator,
+                "name": tumonline_data["operator_name"],
+                "url": f"https://campus.tum.de/tumonline/webnav.navigate_to?corg={operator_id}",
+                "id": operator_id,
             }
-        if tumonline_id := entry.get("tumonline_data", {}).get("tumonline_id", None):
+        if tumonline_id := tumonline_data.get("tumonline_id"):
             entry["props"]["tumonline_room_nr"] = tumonline_id
 
 
-def compute_floor_prop(data: dict[str, Any]) -> None:
+def collect_room_children(data: dict[str, dict[str, Any]]) -> dict[str, list[str]]:
+    """
+    Collect the ids of the rooms among the (flat) children of all entries which can contain rooms.
+
+    The entry types don't change after the structure is built, so this is shared by the section generators.
+    """
+    types_by_id = {_id: entry["type"] for _id, entry in data.items()}
+    return {
+        _id: [child_id for child_id in entry["children_flat"] if types_by_id[child_id] == "room"]
+        for _id, entry in data.items()
+        if entry["type"] in ROOMS_OVERVIEW_PARENT_TYPES and "children_flat" in entry
+    }
+
+
+def compute_floor_prop(data: dict[str, dict[str, Any]], room_children: dict[str, list[str]]) -> None:
     """
     Create a human and machine-readable floor information prop.
 
     This takes into account special floor numbering systems of buildings.
     """
     for _id, entry in data.items():
-        if entry["type"] not in {"building", "joined_building"}:
+        if entry["type"] not in BUILDING_TYPES:
             continue
 
         parent_type = data[entry["parents"][-1]]["type"]
-        if parent_type == "joined_building" or "children_flat" not in entry:
+        if parent_type == "joined_building" or _id not in room_children:
             continue
 
-        room_data = _collect_floors_room_data(data, entry)
-        floor_details = _get_floor_details(entry, room_data)
+        room_props_by_floor = _collect_floors_room_data(data, room_children[_id])
+        floor_details = _get_floor_details(entry, room_props_by_floor)
 
-        entry.setdefault("props", {})["floors"] = floor_details
+        props = entry.get("props")
+        if props is None:
+            props = entry["props"] = {}
+        props["floors"] = floor_details
 
         # Now add this floor information to all children
-        lookup = {floor["tumonline"]: floor for floor in floor_details}
-        for room in room_data:
-            room_entry = data[room["id"]]
-            room_entry.setdefault("props", {})["floor"] = lookup[room["floor"]]
-
-
-def _collect_floors_room_data(data: dict[str, Any], entry: dict[str, Any]) -> list[dict[str, Any]]:
-    """Collect floors of a (joined_)building"""
-    room_data = []
-    for child_id in entry["children_flat"]:
-        child = data[child_id]
-        if child["type"] == "room" and "ids" in child.get("props", {}):
-            roomcode = child["props"]["ids"].get("roomcode", None)
-
-            floor = child.get("generators", {}).get("floors", {}).get("floor_patch", roomcode.split(".")[1])
-
-            room_data.append(
-                {
-                    "id": child_id,
-                    "floor": floor,
-                },
-            )
-
-    return room_data
+        for floor in floor_details:
+            for room_props in room_props_by_floor[floor["tumonline"]]:
+                room_props["floor"] = floor
+
+
+def _collect_floors_room_data(
+    data: dict[str, dict[str, Any]],
+    room_ids: list[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Collect floors of a (joined_)building, mapping each TUMonline floor name to the props of its rooms"""
+    room_props_by_floor: dict[str, list[dict[str, Any]]] = {}
+    for room_id in room_ids:
+        child = data[room_id]
+        if "ids" in child.get("props", {}):
+            floor = child.get("generators", {}).get("floors", {}).get("floor_patch")
+            if floor is None:
+                # The floor is the second part of the roomcode ("<building>.<floor>.<room>")
+                roomcode = child["props"]["ids"].get("roomcode", None)
+                floor = roomcode.partition(".")[2].partition(".")[0]
+
+            room_props_by_floor.setdefault(floor, []).append(child["props"])
+
+    return room_props_by_floor
+
+
+# Floors which can be placed without parsing their name
+FIXED_FLOOR_QUANTIFIERS = {
+    "EG": 0,
+    "DG": 1000,
+    # Tiefparterre / Semi-Basement, default placement: below EG
+    "TP": -5,
+}
+
+
+# There are only a few dozen distinct floor names in the whole dataset
+@functools.cache
+def _floor_quantifier(floor_name: str) -> int:
+    """Assign each floor a virtual ID for sorting"""
+    if (fixed := FIXED_FLOOR_QUANTIFIERS.get(floor_name)) is not None:
+        return fixed
+    if floor_name.startswith("U"):
+        return -10 * int(floor_name[1:])
+    if floor_name.isnumeric():
+        return 10 * int(floor_name)
+    if floor_name.startswith("Z"):
+        # Default placement: Z1 is below 01 etc.
+        return 10 * int(floor_name[1:]) - 5
+    raise RuntimeError(f"Unknown TUMonline floor name {floor_name}")
+
+
+def _build_sorted_floor_list(floors: Iterable[str]) -> list[str]:
+    """Build a physically sorted list of floors (using TUMonline floor names)"""
+    return sorted(floors, key=_floor_quantifier)
 
 
-def _build_sorted_floor_list(room_data):
-    """Build a physically sorted list of floors (using TUMonline floor names)"""
-    floors = {room["floor"] for room in room_data}
-
-    def floor_quantifier(floor_name: str) -> int:
-        """Assign each floor a virtual ID for sorting"""
-        if floor_name == "EG":
-            return 0
-        if floor_name == "DG":
-            return 1000
-        if floor_name.startswith("U"):
-            return -10 * int(floor_name[1:])
-        if floor_name.isnumeric():
-            return 10 * int(floor_name)
-        if floor_name.startswith("Z"):
-            # Default placement: Z1 is below 01 etc.
-            return 10 * int(floor_name[1:]) - 5
-        if floor_name == "TP":  # Tiefparterre / Semi-Basement
-            # Default placement: below EG
-            return -5
-        raise RuntimeError(f"Unknown TUMonline floor name {floor_name}")
-
-    return sorted(floors, key=floor_quantifier)
-
-
-def _get_floor_details(entry, room_data):
+def _get_floor_details(
+    entry: dict[str, Any],
+    room_props_by_floor: dict[str, list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
     """Infer for each floor the metadata and name string"""
-    floors = _build_sorted_floor_list(room_data)
+    floors = _build_sorted_floor_list(room_props_by_floor.keys())
     floors_details = []
 
     patches = entry.get("generators", {}).get("floors", {}).get("floor_patches", {})
@@ -119,7 +182,7 @@ def _get_floor_details(entry, room_data):
         if "name" in patches.get(floor_tumonline, {}):
             floor_name = patches[floor_tumonline]["name"]
             trivial = False
-        elif floor_type in {"roof", "tp"} or mezzanine_shift > 0:
+        elif floor_type in NON_TRIVIAL_FLOOR_TYPES or mezzanine_shift > 0:
             trivial = False
 
         floors_details.append(
@@ -139,7 +202,7 @@ def _get_floor_details(entry, room_data):
     return floors_details
 
 
-def _get_floor_name_and_type(f_id: int, floor: str, mezzanine_shift: int) -> tuple[str, str, _]:
+def _get_floor_name_and_type(f_id: int, floor: str, mezzanine_shift: int) -> tuple[str, str, TranslatableStr]:
     """
     Generate a machine-readable floor type and human-readable floor name (long & short)
 
@@ -155,120 +218,94 @@ def _get_floor_name_and_type(f_id: int, floor: str, mezzanine_shift: int) -> tup
         case "EG":
             if f_id != 0:
                 raise RuntimeError(f"Floor id {f_id} for ground floor {floor} is not 0!")
-            return "ground", "0", _("Erdgeschoss")
+            return "ground", "0", GROUND_FLOOR_NAME
         case "DG":
-            return "roof", str(f_id), _("Dachgeschoss")
+            return "roof", str(f_id), ROOF_FLOOR_NAME
         case "TP":
-            return "tp", "TP", _("Tiefparterre")
+            return "tp", "TP", TP_FLOOR_NAME
         case _ if floor.startswith("U"):
-            floor_name = _(f"{floor[1:]}. ") + _("Untergeschoss")
+            floor_name = _(f"{floor[1:]}. ") + BASEMENT_SUFFIX
             return "basement", f"-{floor[1:]}", floor_name
         case floor if floor.startswith("Z"):
             if f_id == 1:
-                floor_name = _("1. Zwischengeschoss, über EG")
+                floor_name = FIRST_MEZZANINE_NAME
             else:
-                floor_name = _(f"{floor[1:]}. ") + _("Zwischengeschoss")
+                floor_name = _(f"{floor[1:]}. ") + MEZZANINE_SUFFIX
             return "mezzanine", floor, floor_name
     # default case, but mypy doesn't recognize `case _:`
     og_floor = int(floor[1:])
     match mezzanine_shift:
         case 0:
-            floor_name = _(f"{og_floor}. ") + _("Obergeschoss")
+            floor_name = _(f"{og_floor}. ") + UPPER_FLOOR_SUFFIX
         case 1:
-            floor_name = _(f"{og_floor}. ") + _("OG + 1 Zwischengeschoss")
+            floor_name = _(f"{og_floor}. ") + UPPER_FLOOR_ONE_MEZZANINE_SUFFIX
         case mezzanine_shift:
-            floor_name = _(f"{og_floor}. ") + _("OG + {m} Zwischengeschosse").format(m=mezzanine_shift)
+            floor_name = _(f"{og_floor}. ") + UPPER_FLOOR_MEZZANINES_SUFFIX.format(m=mezzanine_shift)
     return "upper", str(og_floor), floor_name
 
 
-class RawComputedProp(typing.TypedDict):
-    name: str
-    text: str
-
+class ComputedProp(typing.TypedDict):
+    name: TranslatableStr | str
+    text: TranslatableStr | str
 
-class TranslatedComputedProp(typing.TypedDict):
-    name: TranslatableStr
-    text: TranslatableStr
 
-
-def compute_props(data: dict[str, Any]) -> None:
+def compute_props(data: dict[str, dict[str, Any]]) -> None:
     """Create the "computed" value in "props"."""
     for _id, entry in data.items():
         if props := entry.get("props"):
-            computed = _gen_computed_props(_id, entry, props)
-
-            # Reformat if required (just to have less verbosity in the code above)
-            reformatted_computed: list[RawComputedProp | TranslatedComputedProp] = []
-            computed_prop: RawComputedProp | dict[TranslatableStr, str]
-            for computed_prop in computed:
-                if "name" in computed_prop:
-                    reformatted_computed.append(
-                        {
-                            "name": computed_prop["name"],
-                            "text": computed_prop["text"],
-                        }
-                    )
-                else:
-                    reformatted_computed.append(
-                        {
-                            "name": next(iter(computed_prop.keys())),
-                            "text": next(iter(computed_prop.values())),
-                        }
-                    )
-
-            entry["props"]["computed"] = reformatted_computed
+            props["computed"] = _gen_computed_props(_id, entry, props)
 
 
 def _append_if_present(
-    props: dict,
-    computed_results: list[dict[TranslatableStr, TranslatableStr | str]],
+    props: dict[str, Any],
+    computed_results: list[ComputedProp],
     key: str,
     human_name: TranslatableStr,
 ) -> None:
     if key in props and props[key] is not None:
-        computed_results.append({human_name: str(props[key])})
+        computed_results.append({"name": human_name, "text": str(props[key])})
 
 
 def _gen_computed_props(
     _id: str,
-    entry: dict[str, str],
-    props: dict,
-) -> list[dict[TranslatableStr | str, TranslatableStr | str]]:
-    computed: list[dict[TranslatableStr, TranslatableStr | str]] = []
+    entry: dict[str, Any],
+    props: dict[str, Any],
+) -> list[ComputedProp]:
+    computed: list[ComputedProp] = []
     if "ids" in props:
-        _append_if_present(props["ids"], computed, "b_id", _("Gebäudekennung"))
-        _append_if_present(props["ids"], computed, "roomcode", _("Raumkennung"))
+        _append_if_present(props["ids"], computed, "b_id", BUILDING_ID_LABEL)
+        _append_if_present(props["ids"], computed, "roomcode", ROOMCODE_LABEL)
         if "arch_name" in props["ids"]:
-            computed.append({_("Architekten-Name"): props["ids"]["arch_name"].split("@")[0]})
+            computed.append({"name": ARCH_NAME_LABEL, "text": props["ids"]["arch_name"].split("@")[0]})
     if floor := props.get("floor"):
         if floor["trivial"]:
-            computed.append({_("Stockwerk"): floor["name"]})
+            computed.append({"name": FLOOR_LABEL, "text": floor["name"]})
         else:
-            computed.append({_("Stockwerk"): f"{floor['floor']} (" + floor["name"] + ")"})
+            computed.append({"name": FLOOR_LABEL, "text": f"{floor['floor']} (" + floor["name"] + ")"})
     if "b_prefix" in entry and entry["b_prefix"] != _id:
         b_prefix = [entry["b_prefix"]] if isinstance(entry["b_prefix"], str) else entry["b_prefix"]
         building_names = ", ".join([p.ljust(4, "x") for p in b_prefix])
-        computed.append({_("Gebäudekennungen"): building_names})
+        computed.append({"name": BUILDING_IDS_LABEL, "text": building_names})
     if address := props.get("address"):
-        computed.append({_("Adresse"): f"{address['street']}, {address['plz_place']}"})
+        computed.append({"name": ADDRESS_LABEL, "text": f"{address['street']}, {address['plz_place']}"})
     if stats := props.get("stats"):
-        _append_if_present(stats, computed, "n_buildings", _("Anzahl Gebäude"))
-        _append_if_present(stats, computed, "n_seats", _("Sitzplätze"))
+        _append_if_present(stats, computed, "n_buildings", N_BUILDINGS_LABEL)
+        _append_if_present(stats, computed, "n_seats", N_SEATS_LABEL)
         if "n_rooms" in stats:
             if stats["n_rooms"] == stats["n_rooms_reg"]:
-                computed.append({_("Anzahl Räume"): str(stats["n_rooms"])})
+                computed.append({"name": N_ROOMS_LABEL, "text": str(stats["n_rooms"])})
             else:
-                value = _("{n_rooms} ({n_rooms_reg} ohne Flure etc.)").format(
+                value = N_ROOMS_WITH_REGULAR_TEMPLATE.format(
                     n_rooms=stats["n_rooms"],
                     n_rooms_reg=stats["n_rooms_reg"],
                 )
-                computed.append({_("Anzahl Räume"): value})
+                computed.append({"name": N_ROOMS_LABEL, "text": value})
     if generic_props := props.get("generic"):
-        computed.extend(generic_props)
+        computed.extend({"name": generic["name"], "text": generic["text"]} for generic in generic_props)
     return computed
 
 
-def localize_links(data: dict[str, Any]) -> None:
+def localize_links(data: dict[str, dict[str, Any]]) -> None:
     """
     Reformat the "links" value in "props" to be explicitly localized.
 
@@ -286,10 +323,16 @@ def localize_links(data: dict[str, Any]) -> None:
                     link["url"] = {"de": link["url"], "en": link["url"]}
 
 
-def generate_buildings_overview(data: dict[str, Any]) -> None:
+def _buildings_overview_sort_key(entry: dict[str, Any]) -> tuple[int, str]:
+    """Sort key for the buildings_overview, ordering buildings by their number of children and then by name"""
+    children_flat = entry.get("children_flat")
+    return len(children_flat) if children_flat else 0, entry["name"]
+
+
+def generate_buildings_overview(data: dict[str, dict[str, Any]]) -> None:
     """Generate the "buildings_overview" section"""
     for _id, entry in data.items():
-        if entry["type"] not in {"area", "site", "campus"} or "children_flat" not in entry:
+        if entry["type"] not in BUILDINGS_OVERVIEW_PARENT_TYPES or "children_flat" not in entry:
             continue
 
         options = entry.get("generators", {}).get("buildings_overview", {"n_visible": 6, "list_start": []})
@@ -298,7 +341,7 @@ def generate_buildings_overview(data: dict[str, Any]) -> None:
         buildings = []
         for child_id in entry["children"]:
             child = data[child_id]
-            if child["type"] in {"area", "site", "campus", "building", "joined_building"}:
+            if child["type"] in BUILDINGS_OVERVIEW_CHILD_TYPES:
                 buildings.append(child)
         # for child_id in entry["children_flat"]:
         #    child = data[child_id]
@@ -307,43 +350,50 @@ def generate_buildings_overview(data: dict[str, Any]) -> None:
         #        and data[child["parents"][-1]]["type"] != "joined_building"):
         #        buildings.append(child)
         # Entries are sorted alphabetically in second order to be predictable
-        buildings = sorted(buildings, key=lambda e: (len(e.get("children_flat", [])), e["name"]), reverse=True)
+        buildings.sort(key=_buildings_overview_sort_key, reverse=True)
 
         # The "list_start" can overwrite how the list of buildings starts,
         # and optionally also add other entries. All other entries are appended
         # after them.
-        merged_ids = options["list_start"] + [b["id"] for b in buildings if b["id"] not in options["list_start"]]
-
-        b_overview = entry.setdefault("sections", {}).setdefault("buildings_overview", {})
+        list_start = options["list_start"]
+        listed_first = set(list_start)
+        merged_ids = list_start + [b["id"] for b in buildings if b["id"] not in listed_first]
+
+        sections = entry.get("sections")
+        if sections is None:
+            sections = entry["sections"] = {}
+        b_overview = sections.setdefault("buildings_overview", {})
         b_overview["n_visible"] = options["n_visible"]
-        b_overview["entries"] = []
+        b_overview["entries"] = overview_entries = []
         for child_id in merged_ids:
             try:
                 child = data[child_id]
             except KeyError as err:
                 raise RuntimeError(f"Unknown id '{child_id}' when generating buildings_overview for '{_id}'") from err
 
-            n_rooms = child["props"]["stats"].get("n_rooms", 0)
-            n_buildings = child["props"]["stats"].get("n_buildings", 0)
-            if child["type"] in {"building", "joined_building"}:
+            stats = child["props"].get("stats") or {}
+            n_rooms = stats.get("n_rooms", 0)
+            n_buildings = stats.get("n_buildings", 0)
+            ctype = child["type"]
+            if ctype in BUILDING_TYPES:
                 if n_rooms == 0:
-                    subtext = _("Keine Räume bekannt")
+                    subtext = NO_ROOMS_SUBTEXT
                 else:
-                    subtext = _("{n_rooms} Räume").format(n_rooms=n_rooms)
-            elif child["type"] == "area":
-                subtext = _("{n_buildings} Gebäude, {n_rooms} Räume").format(n_buildings=n_buildings, n_rooms=n_rooms)
-            elif child["type"] == "site":
-                subtext = _("{n_buildings} Gebäude, {n_rooms} Räume (Außenstelle)").format(
+                    subtext = BUILDING_SUBTEXT.format(n_rooms=n_rooms)
+            elif ctype == "area":
+                subtext = AREA_SUBTEXT.format(n_buildings=n_buildings, n_rooms=n_rooms)
+            elif ctype == "site":
+                subtext = SITE_SUBTEXT.format(
                     n_buildings=n_buildings,
                     n_rooms=n_rooms,
                 )
             else:
                 raise RuntimeError(
-                    f"Cannot generate buildings_overview subtext for type '{child['type']}', "
+                    f"Cannot generate buildings_overview subtext for type '{ctype}', "
                     f"for: '{_id}', child id: '{child_id}'",
                 )
 
-            b_overview["entries"].append(
+            overview_entries.append(
                 {
                     "id": child_id,
                     "name": child["short_name"] if "short_name" in child else child["name"],
@@ -353,34 +403,33 @@ def generate_buildings_overview(data: dict[str, Any]) -> None:
             )
 
 
-def generate_rooms_overview(data: dict[str, dict[str, Any]]) -> None:
+def generate_rooms_overview(data: dict[str, dict[str, Any]], room_children: dict[str, list[str]]) -> None:
     """Generate the "rooms_overview" section"""
-    for _id, entry in data.items():
-        # if entry["type"] not in {"building", "joined_building", "virtual_room"} or \
-        if (
-            entry["type"] not in {"area", "site", "campus", "building", "joined_building", "virtual_room"}
-            or "children_flat" not in entry
-        ):
-            continue
-
-        rooms = {}
-        for child_id in entry["children_flat"]:
-            child = data[child_id]
-            if child["type"] == "room":
-                usage = child["usage"] if "usage" in child else {"name": _("Unbekannt")}
-                rooms.setdefault(usage["name"], []).append(
-                    {
-                        "id": child_id,
-                        "name": child["name"],
-                    },
-                )
+    by_name = itemgetter("name")
+    by_usage_name = itemgetter(0)
+    for _id, room_ids in room_children.items():
+        entry = data[_id]
+        rooms: dict[TranslatableStr | str, list[dict[str, Any]]] = {}
+        for room_id in room_ids:
+            room = data[room_id]
+            usage = room.get("usage")
+            usage_name = usage["name"] if usage is not None else UNKNOWN_USAGE_NAME
+            rooms.setdefault(usage_name, []).append(
+                {
+                    "id": room_id,
+                    "name": room["name"],
+                },
+            )
 
-        r_overview = entry.setdefault("sections", {}).setdefault("rooms_overview", {})
+        sections = entry.get("sections")
+        if sections is None:
+            sections = entry["sections"] = {}
+        r_overview = sections.setdefault("rooms_overview", {})
         r_overview["usages"] = [
             {
-                "name": u[0],
-                "count": len(u[1]),
-                "children": sorted(u[1], key=lambda r: r["name"]),
+                "name": usage_name,
+                "count": len(usage_rooms),
+                "children": sorted(usage_rooms, key=by_name),
             }
-            for u in sorted(rooms.items(), key=lambda e: e[0])
+            for usage_name, usage_rooms in sorted(rooms.items(), key=by_usage_name)
         ]
@@ -0,0 +1,15 @@
+import pytest
+from processors.sections import _build_sorted_floor_list
+
+
+def test_floors_are_sorted_physically() -> None:
+    """Floors are sorted from the lowest basement to the roof, mezzanines below their upper floor"""
+    floors = ["DG", "01", "Z1", "EG", "U1", "TP", "U2", "02", "Z2"]
+    expected = ["U2", "U1", "TP", "EG", "Z1", "01", "Z2", "02", "DG"]
+    assert _build_sorted_floor_list(floors) == expected
+
+
+def test_unknown_floor_name() -> None:
+    """Floor names which can't be placed raise an error"""
+    with pytest.raises(RuntimeError):
+        _build_sorted_floor_list(["XY"])
@@ -139,7 +139,6 @@ def merge_tumonline_rooms(data: dict[str, dict[str, Any]]) -> None:
 
         if room.arch_name:
             r_data["props"]["ids"]["arch_name"] = room.arch_name
-        room.seats.model_dump()
         # Usage
         if room.usage_id in usages_lookup:
             tumonline_usage = usages_lookup[room.usage_id]
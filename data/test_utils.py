@@ -0,0 +1,10 @@
+from utils import TranslatableStr
+
+
+def test_translatable_str_format_does_not_mutate() -> None:
+    """Formatting returns a new TranslatableStr, shared templates stay untouched"""
+    template = TranslatableStr("{n} Räume", "{n} rooms")
+    formatted = template.format(n=3)
+    assert formatted is not template
+    assert formatted == {"de": "3 Räume", "en": "3 rooms"}
+    assert template == {"de": "{n} Räume", "en": "{n} rooms"}
@@ -75,9 +75,7 @@ class TranslatableStr(dict):
 
     def format(self, *args: Any, **kwargs: Any) -> "TranslatableStr":
         """Apply the format-method to the contained data, as if the class itsself was a string."""
-        self["de"] = self["de"].format(*args, **kwargs)
-        self["en"] = self["en"].format(*args, **kwargs)
-        return self
+        return TranslatableStr(self["de"].format(*args, **kwargs), self["en"].format(*args, **kwargs))
 
 
 def convert_to_webp(source: Path) -> None: